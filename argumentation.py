@@ -45,13 +45,32 @@ This system also uses a notion of cases and "support" built on this
         contributes exactly one such set to this union, is a CCoSE of R.
 '''
 
+_UNSET = object()  # Marks a memoised value of a Case that has not been calculated yet
+
 class Case():
     
+    # One Case per Literal of a KB, so no per-instance __dict__
+    __slots__ = ("_claim", "_kb", "_id", "_asserting_clauses", "_asserting_rules",
+                 "_supporting_rules", "_hash")
+    
     def __init__(self, literal, knowledgebase):
         self._claim = literal
         self._kb = knowledgebase
-        self._asserting_clauses = frozenset(self.kb._asserting_clauses[str(self.claim)])
-        self._asserting_rules = frozenset(self.kb._asserting_rules[str(self.claim)])
+        # The id of self.claim in the KB; an equal Literal maps to the KB's own instance
+        literal_id = knowledgebase._literal_ids.get(id(literal))
+        if literal_id is None:
+            own_literal = knowledgebase._literals_dict.get(str(literal))
+            if own_literal is None:
+                raise ValueError("{} is not a Literal of this KnowledgeBase".format(literal))
+            literal_id = knowledgebase._literal_ids[id(own_literal)]
+        self._id = literal_id
+        # These are the KB's own (frozen) sets, shared rather than copied.
+        self._asserting_clauses = knowledgebase._asserting_clauses[self._id]
+        self._asserting_rules = knowledgebase._asserting_rules[self._id]
+        # Memoised value, calculated on the first call to self.supporting_rules
+        self._supporting_rules = _UNSET
+        # A Case's claim and kb never change, so neither does its hash
+        self._hash = hash((literal, knowledgebase))
     
     @property  # no setter for claim
     def claim(self):
@@ -69,38 +88,32 @@ class Case():
     def asserting_rules(self):
         return self._asserting_rules
     
-    # Initiates is_entailed for this case (which in turn value for self.supporting_rules)
-    
     @property  # no setter for supporting_rules
     def supporting_rules(self):
-        if not hasattr(self, "_supporting_rules"):
-            self.is_entailed  # This function will calculate self._supporting_rules
+        """
+        All supported Rules in self.kb that assert self.claim.
+        This value is calculated only once on the first call, and only when
+            asked for; self.is_entailed does not need it.
+        """
+        if self._supporting_rules is _UNSET:
+            # Every Rule's support is resolved when self.kb is created, so this does not recurse
+            self._supporting_rules = tuple(r for r in self.asserting_rules if r.is_supported)
         return self._supporting_rules
     
     @property
     def is_contained(self):
-        if not hasattr(self, "_contained"):  # If we haven't done this check before, calculate its value     
-            self._contained = False  # First assume self.claim is not contained in self.kb  
-            self._asserting_clauses = frozenset(self.kb._asserting_clauses[str(self.claim)])  # Get all supporting clauses in the self.kb for self.claim
-            if len(self._asserting_clauses) != 0:  # If there exists any clauses in self.kb that assert self.claim
-                self._contained = True  # Then self.claim is contained in self.kb
-        return self._contained
+        # self.claim is contained in self.kb iff any clauses in self.kb assert it
+        return self._kb._literal_has_clause[self._id]
     
-    # Generates self.supporting_rules
     @property
     def is_entailed(self):
-        if not hasattr(self, "_entailed"):  # If we haven't done this check before, calculate its value     
-            entailed = False  # Assume self.claim is not entailed by self.kb   
-            # Check for supporting Rules in the KB (i.e supported Rules that assert self.claim)
-            self._supporting_rules = set()
-            for r in self.asserting_rules:
-                if r.is_supported:
-                    entailed = True  # If any such rules exist, self.claim is supported
-                    self._supporting_rules.add(r)
-                    # Keep checking through all asserting_rules so all _supporting_rules can be found
-            self._supporting_rules = frozenset(self._supporting_rules)  # for hashability
-            self._entailed = entailed
-        return self._entailed
+        # self.claim is entailed by self.kb iff any supported Rules assert it
+        return self._kb._literal_entailed[self._id]
+    
+    @property
+    def is_supported(self):
+        # self.claim is supported by self.kb iff it is contained or entailed
+        return self._kb._literal_supported[self._id]
     
     def __str__(self): ###### TEMPORARY
         return "({" + " ".join([str(c) for c in self._asserting_clauses] + [str(r) for r in self._asserting_rules]) + "}, " + str(self.claim) + ")" 
@@ -109,7 +122,7 @@ class Case():
         return str(self)
     
     def __hash__(self):
-        return hash((self.claim, self.kb))
+        return self._hash
     
     def __eq__(self, other):
         if isinstance(other, Case):
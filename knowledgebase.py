@@ -6,8 +6,124 @@ amadeus.logic - A Simple Logic
 from logic import Clause, Literal, Rule
 from argumentation import Case
 from itertools import product, chain
-from functools import reduce
-from operator import concat
+import os
+import re
+
+# Precompiled pattern for PrologString's parser. Each match is a token; either
+#     a Literal (without the whitespace around it), a ':-', or a '.'. Whitespace
+#     and the ','s between Literals are skipped over.
+# A ':' that does not start a ':-' is kept as part of the Literal it is in (or
+#     next to), rather than silently skipped over.
+_TOKEN_RE = re.compile(r"((?:[^,.:\s]|:(?!-))(?:(?:[^,.:]|:(?!-))*(?:[^,.:\s]|:(?!-)))?)|(:-)|(\.)")
+
+def _fixpoint(literal_has_clause, rule_heads, rule_antecedent_offsets, rule_antecedent_literals):
+    """
+    Resolves the support of every Literal and Rule of a KB at once, where the
+        KB has been encoded with integer ids by KnowledgeBase._compile.
+    
+    Every Rule keeps a count of its antecedent Literals not yet known to be
+        supported. Starting from the contained Literals, each Literal found to
+        be supported is visited once, and the count of every Rule it is an
+        antecedent of is decremented. A Rule whose count reaches 0 is supported,
+        and its consequent Literal entailed (and then visited in turn). So each
+        antecedent of each Rule is looked at no more than once.
+    
+    Returns a triple of lists (supported, entailed, rule_supported), the first
+        two indexed by Literal id and the last by Rule id, where a Literal is
+        supported iff it is contained or entailed.
+    """
+    literal_count, rule_count = len(literal_has_clause), len(rule_heads)
+    dependent_rules = [[] for _ in range(literal_count)]  # Literal id -> ids of the Rules it is an antecedent of
+    unsupported_counts = [0] * rule_count  # Rule id -> number of antecedents not yet known to be supported
+    for r in range(rule_count):
+        start, end = rule_antecedent_offsets[r], rule_antecedent_offsets[r + 1]
+        unsupported_counts[r] = end - start
+        for l in rule_antecedent_literals[start:end]:
+            dependent_rules[l].append(r)
+    
+    supported = list(literal_has_clause)  # Contained Literals are supported from the outset
+    entailed = [False] * literal_count
+    rule_supported = [False] * rule_count
+    worklist = [l for l, is_supported in enumerate(supported) if is_supported]  # Supported, not yet visited
+    # Rules without any antecedent Literals are supported outright, as no Literal will ever visit them.
+    for r, count in enumerate(unsupported_counts):
+        if not count:
+            rule_supported[r] = entailed[rule_heads[r]] = True
+            if not supported[rule_heads[r]]:
+                supported[rule_heads[r]] = True
+                worklist.append(rule_heads[r])
+    while worklist:
+        for r in dependent_rules[worklist.pop()]:
+            unsupported_counts[r] -= 1
+            if not unsupported_counts[r]:  # If this was the Rule's last unsupported antecedent Literal
+                head = rule_heads[r]
+                rule_supported[r] = entailed[head] = True
+                if not supported[head]:  # Each Literal is visited only once
+                    supported[head] = True
+                    worklist.append(head)
+    return supported, entailed, rule_supported
+
+def _find_cycle(rule_heads, rule_antecedent_offsets, rule_antecedent_literals, literal_count):
+    """
+    Looks for a cycle between the Literals of a KB, where the KB has been
+        encoded with integer ids by KnowledgeBase._compile, and each Rule makes
+        its consequent depend on each of its antecedent Literals.
+    
+    This finds the strongly connected components (SCCs) of this dependency
+        graph with Tarjan's algorithm, in a single O(V+E) pass. It is iterative,
+        with an explicit stack, so deep KBs do not hit Python's recursion limit.
+    
+    Returns a list of the ids of the Literals in the first cycle found (an SCC
+        of more than one Literal, or a Literal that depends on itself), or None
+        if there are no cycles.
+    """
+    successors = [[] for _ in range(literal_count)]  # Literal id -> ids of the Literals it depends on
+    for r, head in enumerate(rule_heads):
+        successors[head].extend(rule_antecedent_literals[rule_antecedent_offsets[r]:rule_antecedent_offsets[r + 1]])
+    
+    index = [None] * literal_count  # The order in which each Literal was first visited
+    lowlink = [0] * literal_count   # The lowest index reachable from each Literal within its SCC
+    on_stack = [False] * literal_count
+    stack = []  # Visited Literals that are not yet assigned to an SCC
+    counter = 0
+    for root in range(literal_count):
+        if index[root] is not None:
+            continue
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, iter(successors[root]))]  # The current path, with each Literal's unvisited successors
+        while work:
+            v, children = work[-1]
+            for w in children:
+                if w == v:  # v depends on itself
+                    return [v]
+                if index[w] is None:  # Visit w next, then come back to v's remaining successors
+                    index[w] = lowlink[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, iter(successors[w])))
+                    break
+                elif on_stack[w]:
+                    lowlink[v] = min(lowlink[v], index[w])
+            else:  # All of v's successors have been visited
+                work.pop()
+                if work:
+                    u = work[-1][0]
+                    lowlink[u] = min(lowlink[u], lowlink[v])
+                if lowlink[v] == index[v]:  # v is the root of an SCC; pop it
+                    scc = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        scc.append(w)
+                        if w == v:
+                            break
+                    if len(scc) > 1:
+                        return scc
+    return None
 
 class KnowledgeBase():
     """
@@ -39,6 +155,11 @@ class KnowledgeBase():
         rules (set of Rules):
             A set of all Rules in the KB
     """
+    
+    __slots__ = ("_literals_dict", "_clauses", "_rules", "_asserting_clauses", "_asserting_rules",
+                 "_literal_keys", "_literal_ids", "_rules_by_id",
+                 "_literal_has_clause", "_rule_heads", "_rule_antecedent_offsets", "_rule_antecedent_literals",
+                 "_literal_supported", "_literal_entailed", "_rule_supported", "_cases", "_supported_literals")
   
     def __init__(self, *contents):
         """
@@ -72,8 +193,8 @@ class KnowledgeBase():
             #     their unique instances. Note that these are the exact Literal 
             #     instances ps's Clauses and Rules reference. 
             self._literals_dict = ps.literals 
-            self._clauses = ps.clauses  # Set of all Clauses
-            self._rules = ps.rules      # Set of all Rules
+            self._clauses = ps.clauses  # (Frozen) set of all Clauses
+            self._rules = ps.rules      # (Frozen) set of all Rules
         
         # Otherwise, assume contents are all Clause and Rule instances, and
         #     create a KB from them. Note that this method recreates all
@@ -95,46 +216,72 @@ class KnowledgeBase():
             self._rules = set()    # to store Rule instances
 
             for content in contents:
-                if isinstance(content, Clause):
-                    # Consolidation of the Literals in content.literals
-                    literals = self._consolidate_literals(content.literals)
-                    # Creating a new Clause from these literals and storing.
-                    self._clauses.add(Clause(*literals))
-                elif isinstance(content, Rule):
-                    # Consolidation of the Literal in content.head
-                    head = self._consolidate_literal(content.head)
-                    # Consolidation of the Literals in content.body
-                    body = self._consolidate_literals(content.body)
-       
-                    # Creating a new Rule from this head and body, then storing.
-                    self._rules.add(Rule(head, *body))
-                else:
+                # Dispatch on the type of content with a single dict lookup
+                add = self._content_adders.get(type(content))
+                if add is None:
                     raise TypeError("Cannot add content of type {} to a KnowledgeBase".format(type(content).__name__))
+                add(self, content)
+            
+            self._clauses, self._rules = frozenset(self._clauses), frozenset(self._rules)  # helps with hashability of KB
+            # (PrologString already gives frozensets, so the other branch needs no such copy)
         
-        self._clauses, self._rules = frozenset(self._clauses), frozenset(self._rules)  # helps with hashability of KB
-        # TODO: Add cycle checking and forbid KB contents (abort) if cyclic.
         
+        # ASSIGNING AN INTEGER ID TO EVERY LITERAL:
+        #     Since the Literal instances of this KB are unique, they are told
+        #     apart by their identity (id(L)), which is cheaper to hash than
+        #     str(L). This id is mapped to the Literal's integer id, and every
+        #     per-Literal index below is a tuple indexed by the integer id.
+        self._literal_keys = list(self._literals_dict)  # Maps Literal ids to str representations of Literals
+        self._literal_ids = {id(l) : i for i, l in enumerate(self._literals_dict.values())}  # Maps id(L) to Literal ids
         
-        # GETTING MAPPINGS FROM STR REPRESENTATIONS OF LITERALS TO:
+        # GETTING MAPPINGS FROM LITERAL IDS TO:
         #     - THE CLAUSES THAT ASSERT THEM
         #     - THE RULES THAT ASSERT THEM
         
-        # For each Literal L in self._literals_dict.values(), get the set of
-        #     Clauses that assert it in a dict, indexed by str(L).
+        # For each Literal L in self._literals_dict.values(), get the (frozen)
+        #     set of Clauses that assert it in a tuple, indexed by L's id.
+        # These indexes are built once here, and the Cases of this KB reference
+        #     their sets directly rather than copying them.
         self._asserting_clauses = self._get_asserting_clauses()
 
         # And do the same for Rules;
         # For each Literal L in self._literals_dict.values(), get the set of
-        #     Rules that assert it (as its head) in a dict, indexed by str(L).
+        #     Rules that assert it (as its head) in a tuple, indexed by L's id.
         self._asserting_rules = self._get_asserting_rules()
         
+        # RESOLVING THE SUPPORT OF ALL LITERALS AND RULES IN ONE PASS:
+        
+        # Assign integer ids to every Rule, and encode the Rules' consequents
+        #     and antecedents as flat lists of Literal ids.
+        self._compile()
+        
+        # Forbid KB contents (abort) if cyclic.
+        cycle = _find_cycle(self._rule_heads, self._rule_antecedent_offsets, self._rule_antecedent_literals, len(self._literal_keys))
+        if cycle is not None:
+            raise ValueError("A KnowledgeBase cannot contain cycles, but found a cycle between: {}".format(", ".join(self._literal_keys[i] for i in cycle)))
+        
+        # Find which Literals are supported (contained or entailed) and
+        #     entailed, and which Rules are supported, by iterating to a
+        #     fixpoint over these lists (rather than recursing from each Case
+        #     through Rules and back into Cases). These tables are the KB's
+        #     single memo of support; each Rule's support is then already known
+        #     when its is_supported is called, and each Case reads its claim's
+        #     from them.
+        self._literal_supported, self._literal_entailed, self._rule_supported = _fixpoint(self._literal_has_clause, self._rule_heads,
+                                                                                           self._rule_antecedent_offsets, self._rule_antecedent_literals)
+        for r, supported in zip(self._rules_by_id, self._rule_supported):
+            r._supported = supported
+        
         # For each Literal L in self._literals_dict.values(), create a Case instance
         # C such that L.case = C and C.claim = L.
         self._cases = self._generate_cases()
         
-        # ASSOCIATING ALL CASES WITH THEIR SUPPORTING CLAUSES AND RULES:
-        #     - This process is prompted when is_entailed() called on a Case
-        self._supported_literals = {k : v for k,v in self._literals_dict.items() if v.is_entailed}
+        # ASSOCIATING ALL CASES WITH THEIR SUPPORTING RULES:
+        #     - Each Case works out its supporting Rules when its
+        #         supporting_rules is first asked for, and only then; which
+        #         Literals are entailed is already known from the fixpoint
+        #         above, so no Case needs resolving here.
+        self._supported_literals = {k : self._literals_dict[k] for k, entailed in zip(self._literal_keys, self._literal_entailed) if entailed}
     
     @property  # no setter for clauses
     def clauses(self):
@@ -148,36 +295,114 @@ class KnowledgeBase():
     def cases(self):
         return self._cases
     
+    def resolve_cases(self, literals):
+        """
+        Returns a dict mapping each Literal in literals to the Case of the
+            equal Literal in this KB. The Literals given need not be this KB's
+            own instances (e.g. those used to create this KB from Clauses and
+            Rules).
+        Raises KeyError if any Literal in literals does not appear in this KB.
+        
+        Note that the support of every Case in this KB is resolved when this KB
+            is created, so each Literal here costs a single lookup.
+        """
+        return {l : self._literals_dict[str(l)].case for l in literals}
+    
+    def _add_clause(self, clause):
+        """
+        Function that recreates Clause clause from this KB's own Literals, and
+            adds it to self._clauses.
+        """
+        # Consolidation of the Literals in clause.sorted_literals (clause.literals is built on demand)
+        literals = self._consolidate_literals(clause.sorted_literals)
+        # Creating a new Clause from these literals and storing.
+        self._clauses.add(Clause(*literals))
+    
+    def _add_rule(self, rule):
+        """
+        Function that recreates Rule rule from this KB's own Literals, and adds
+            it to self._rules.
+        """
+        # Consolidation of the Literal in rule.head
+        head = self._consolidate_literal(rule.head)
+        # Consolidation of the Literals in rule.body
+        body = self._consolidate_literals(rule.body)
+        # Creating a new Rule from this head and body, then storing.
+        self._rules.add(Rule(head, *body))
+    
+    # Maps the types of content a KB can be created from to the functions that add them
+    _content_adders = {Clause : _add_clause, Rule : _add_rule}
+    
     def _consolidate_literal(self, l):
         """
         Function that returns the original version of Literal l in self._literals_dict, or adds it if there is no original, and returns l.
         """
-        if not str(l) in self._literals_dict:  # If l is a new Literal
-            self._literals_dict[str(l)] = Literal(l.atom, l.is_positive)  # Recreate and add to self._literals_dict
-        return self._literals_dict[str(l)]  # And return our unique instance
+        key = str(l)
+        literal = self._literals_dict.get(key)
+        if literal is None:  # If l is a new Literal
+            literal = self._literals_dict[key] = l._recreated()  # Recreate and add to self._literals_dict
+        return literal  # And return our unique instance
     
     def _consolidate_literals(self, literals):
         """
         Function that runs self._consolidate_literal on an iterable of Literals,
-            and returns as a set
+            and returns an iterator over the results.
+        This is not collected into a set first, since the Clause or Rule these
+            are unpacked into drops any repeated Literals anyway.
         """
-        return set([self._consolidate_literal(l) for l in literals])
+        return map(self._consolidate_literal, literals)
         
     def _get_asserting_clauses(self):
         """
         # For each Literal in literals, get the set of Clauses that assert it
-        # Then put these sets in a dictionary, indexed by the str representation of the Literal they assert.
+        # Then put these sets in a tuple, indexed by the id of the Literal they assert.
+        This takes a single pass over self.clauses, filing each Clause under
+            every Literal it asserts, rather than a pass over self.clauses per
+            Literal.
         """
-        literals = self._literals_dict.values()  # Set of all Literal instances
-        return {str(l) : set([clause for clause in self.clauses if l in clause.literals]) for l in literals}
+        literal_ids = self._literal_ids
+        asserting_clauses = [[] for _ in self._literal_keys]  # An entry for every Literal
+        for clause in self.clauses:
+            for l in clause.sorted_literals:
+                asserting_clauses[literal_ids[id(l)]].append(clause)
+        return tuple(frozenset(clauses) for clauses in asserting_clauses)
     
     def _get_asserting_rules(self):
         """
         For each Literal in literals, get the set of Rules that assert it as its head
-        # Then put these sets in a dictionary, indexed by the str representation of the Literal they assert.
+        # Then put these sets in a tuple, indexed by the id of the Literal they assert.
+        This takes a single pass over self.rules, filing each Rule under its head,
+            rather than a pass over self.rules per Literal.
         """
-        literals = self._literals_dict.values()  # Set of all Literal instances
-        return {str(l) : set([rule for rule in self.rules if l == rule.head]) for l in literals}
+        literal_ids = self._literal_ids
+        asserting_rules = [[] for _ in self._literal_keys]  # An entry for every Literal
+        for rule in self.rules:
+            asserting_rules[literal_ids[id(rule.head)]].append(rule)
+        return tuple(frozenset(rules) for rules in asserting_rules)
+    
+    def _compile(self):
+        """
+        Assigns an integer id to every Rule in this KB, and encodes the KB
+            with these ids and the ids of its Literals as:
+                - self._literal_has_clause: for each Literal id, whether any
+                    Clause asserts that Literal.
+                - self._rule_heads: for each Rule id, the id of its consequent.
+                - self._rule_antecedent_literals: the ids of the antecedent
+                    Literals of every Rule, concatenated in Rule id order.
+                - self._rule_antecedent_offsets: for each Rule id r, the
+                    antecedent of Rule r lies between positions
+                    self._rule_antecedent_offsets[r] and
+                    self._rule_antecedent_offsets[r + 1] of the above.
+        """
+        self._rules_by_id = tuple(self.rules)  # Maps Rule ids to Rules
+        
+        self._literal_has_clause = [len(clauses) != 0 for clauses in self._asserting_clauses]
+        self._rule_heads = [self._literal_ids[id(r.head)] for r in self._rules_by_id]
+        self._rule_antecedent_offsets = [0]
+        self._rule_antecedent_literals = []
+        for r in self._rules_by_id:
+            self._rule_antecedent_literals.extend(self._literal_ids[id(l)] for l in r.body)
+            self._rule_antecedent_offsets.append(len(self._rule_antecedent_literals))
     
     def _generate_cases(self):
         """
@@ -196,7 +421,7 @@ class KnowledgeBase():
     
     def __str__(self):
         """Returns a string representation of the KnowledgeBase contents in prolog syntax"""
-        return "".join(["{}\n".format(str(s)) for s in self.clauses.union(self.rules)])
+        return "".join(map("{}\n".format, chain(self.clauses, self.rules)))
          
 class PrologString():
     """
@@ -214,15 +439,13 @@ class PrologString():
     
     def __init__(self, s):
         if isinstance(s, str):
-            try:
+            self._literals_dict = dict()  # to hold the Literal instances shared between Clauses and Rules
+            if os.path.isfile(s):  # If s is a filename, parse the file's contents as they are read
                 with open(s) as infile:
-                    s = infile.read()
-            except (FileNotFoundError, OSError) as err:
-                pass  # If not a file, assume s is intended to be a prolog-syntax string.
+                    self._clauses, self._rules = self._parse(self._read_statements(infile))
+            else:  # If not a file, assume s is intended to be a prolog-syntax string.
                 # TODO: A check to see if s is in prolog syntax can be implemented; If it is not in prolog syntax, raise. Otherwise, pass.
-            
-            self._literals_dict = dict()  # to hold the Literal instances shared between Clauses and Rules
-            self._clauses, self._rules = self._parse(s)
+                self._clauses, self._rules = self._parse((s,))
         else:
             raise TypeError("PrologString takes a str input of a (simple logic) prolog-syntax knowledge base, or the filemame of a textfile containing the same. Invalid input: {}".format(repr(s)))
   
@@ -238,74 +461,69 @@ class PrologString():
     def literals(self):
         return self._literals_dict
 
-    def _parse(self, s):
-        """Turns a string s in Prolog syntax into a set of Clauses and a set of Rules."""
-        
+    def _read_statements(self, infile, size=1 << 16):
+        """
+        Returns a collection (generator) of strings read from the text-file
+            infile, roughly size characters at a time, where each string ends
+            at the end of a statement (i.e after a '.'), bar the last.
+        This means no statement is split between two strings, and only about
+            size characters of infile are held in memory at a time.
+        """
+        remainder = ""  # The start of a statement that has not been read in full yet
+        for chunk in iter(lambda: infile.read(size), ""):
+            chunk = remainder + chunk
+            end = chunk.rfind(".") + 1  # Just after the last '.' in chunk (or 0 if there is none)
+            yield chunk[:end]
+            remainder = chunk[end:]
+        yield remainder
+    
+    def _parse(self, strings):
+        """
+        Turns an iterable of strings in Prolog syntax, where no statement is split
+            between two strings, into a frozenset of Clauses and a frozenset of Rules.
+        This takes a single forward scan over each string, which yields each
+            Literal (without the whitespace around it), ':-' and '.' as a token,
+            and builds each statement from these tokens as it goes. Only the text
+            of each Literal is ever copied out of the strings.
+        """
         clauses = set()
         rules = set()
         # TODO: Add syntax checks to ensure Clauses and Rules are in correct prolog-syntax before passing to the parsers.
-        for p in s.split("."):  # Splitting s into statements
-            p = p.strip()
-            if p == "":  # Ignore empty strings (e.g trailing whitespace after last '.').
-                continue
-            elif ":-" in p:  # If ":-" in p, assume p is a Rule
-                rules.add(self._parse_rule(p))
-            else:  # Otherwise assume p is a Clause
-                clauses.add(self._parse_clause(p))
-        return clauses, rules
-                
-    def _parse_rule(self, s):
-        """Takes a string s, splits it around ':-', and assumes only 2 substrings will result from this, s1 and s2.
-            Strips whitespace from s1 and assumes it is a (simple logic) prolog-syntax Literal.
-            Converts s1 to its corresponding Literal with _parse_literal(s), and sets head equal to this Literal.
-            Strips whitespace from s2 and assumes it is a string of comma separated (simple logic) prolog-syntax Literals.
-            Converts s2 to a set of the corresponding Literals with _parse_literals(s), and sets body equal to this set.
-        """
-        head, body = s.split(":-")    
-        head = self._parse_literal(head.strip())
-        body = self._parse_literals(body.strip())
-        return Rule(head, *body)
+        head = None     # The head of the current statement, if it is a Rule
+        literals = []   # The Literals of the current statement (the body, if it is a Rule) read so far
+        # An extra '.' token is scanned after each string, to end a last statement that has no '.'
+        tokens = chain.from_iterable(chain(_TOKEN_RE.findall(string), [("", "", ".")]) for string in strings)
+        for literal, neck, _ in tokens:
+            if literal:
+                literals.append(self._parse_literal(literal))
+            elif neck:  # The Literal read so far is the head of a Rule
+                if head is not None or len(literals) != 1:
+                    raise ValueError("Rules must have exactly one head Literal and one ':-'. Invalid head: {}".format(literals))
+                head = literals.pop()
+            else:  # End of statement
+                if head is not None:
+                    rules.add(Rule(head, *literals))
+                elif literals:  # Ignore empty statements (e.g trailing whitespace after last '.')
+                    clauses.add(Clause(*literals))
+                head, literals = None, []
+        return frozenset(clauses), frozenset(rules)
         
     def _parse_literal(self, s):
         """
-        s is assumed to be a string of a (simple logic) prolog-syntax Literal.
-        Takes a string s, strips whitespace from s, and checks for '~' in s[0]:
+        s is assumed to be a string of a (simple logic) prolog-syntax Literal,
+            without whitespace around it (as matched by _TOKEN_RE).
+        Takes a string s, and checks for '~' in s[0]:
             If s[0] != '~', s is taken as a positive literal, and Literal(s) is returned.
             Otherwise, s is taken as a negative literal, and Literal(s, False) is returned.
         """
-        s = s.strip()  # shouldn't need this since all functions that call this method strip s before call, but redundancy just in case.
-        if not s in self._literals_dict:  # If we have not encountered this literal before
+        literal = self._literals_dict.get(s)  # One lookup when this literal has been seen before
+        if literal is None:  # If we have not encountered this literal before
             if s[0] == "~":  # If this is a negative Literal
                 literal = Literal(s[1:], False)
             else:  # Otherwise this is a positive Literal
                 literal = Literal(s)
             self._literals_dict[s] = literal  # Add this Literal to all the set of all Literals
-        return self._literals_dict[s]  # And return it
-    
-    def _parse_literals(self, s):
-        """
-        s is assumed to be a string of comma separated (simple logic) prolog-syntax Literals.
-        This function:
-            Takes s, splits it around ','s, and strips the whitespace from these substrings.
-            The substrings are assumed to be literals and are converted as such with _parse_literal(s).
-            The resulting Literals are returned in a set.
-        """
-        literals = set()
-        for l in s.split(","):  # Split s into literals
-            l = l.strip()
-            if l != "":  # Ignore e.g the railing whitespace after the last ','
-                literals.add(self._parse_literal(l))
-        return literals
-    
-    def _parse_clause(self, s):
-        """
-        s is assumed to be a (simple logic) prolog-syntax Clause.
-        This function:
-            Takes s, obtains a set of its Literals with with _parse_literals(s).
-            These Literals are used to instantiate a Clause, which is then returned.
-        """
-        literals = self._parse_literals(s)
-        return Clause(*literals)
+        return literal  # And return it
     
     def __str__(self):
         return super().__str__()    
@@ -375,13 +593,10 @@ if __name__ == "__main__":
         """
         Returns a collection (generator) of sets of supporting evidence for Rule r.
         """
-        yield from (reduce(set().union, ccose).union({r})  for ccose in product(*(literal_supporting_evidence(l) for l in r.body)))
-        """
-        Equivalent to:
-        antecedent_evidence_items = [literal_supporting_evidence(l.case) for l in r.body]
-        for antecedent_evidence_item in product(*antecedent_evidence_items):
-            yield reduce(set().union, antecedent_evidence_item).union({r})
-        """ 
+        for ccose in product(*(literal_supporting_evidence(l) for l in r.body)):
+            evidence = {r}
+            evidence.update(*ccose)  # In place, rather than building a new set per union
+            yield evidence
     
     def literal_supporting_evidence(l):
         """
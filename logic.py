@@ -102,7 +102,13 @@ This system also uses the notion of Cases and "support" used by
     argumentation.py (see preamble of argumentation.py).
 """
 # TODO: Should CCoSE's be minimal sets?
-from ast import literal_eval
+from operator import attrgetter
+import re
+
+# Precompiled pattern for a valid atom; chars "a-zA-Z0-9_", with at least 1
+#     non-numerical char. The leading run of digits can only match one way, so
+#     this does not backtrack.
+_ATOM_RE = re.compile(r"[0-9]*[A-Za-z_][A-Za-z0-9_]*")
 
 class Literal():
     """
@@ -125,25 +131,44 @@ class Literal():
             True if this Literal/its case is supported by its KB, False if not.
     """
     
+    # No per-instance __dict__; _case is None until the case setter is called
+    __slots__ = ("_atom", "_is_positive", "_case", "_str", "_hash")
+    
     def __init__(self, atom, is_positive=None):
         """
         Parameters:
             atom (str):
                 The string representation of this Literal's atom. This is
                 case-sensitive and should be non-empty, containing only chars
-                "a-zA-Z0-9_", with at least 1 non-numerical char.
+                "a-zA-Z0-9_", with at least 1 non-numerical char. Raises
+                TypeError if it is not a str, and ValueError if it is not
+                in this format.
             is_positive (bool | None): 
                 The sign of this Literal; True if positive, False if negative.
         Return type: None
         """
-        # TODO: Implement checks to ensure atom is a nonempty str in the right format (a-zA-Z0-9_ with at least one non-numerical char).
-        #     Currently this property is assumed.
-        self._atom = atom
+        if not isinstance(atom, str):
+            raise TypeError("atom must be a str, but got: {}".format(type(atom).__name__))
+        # Most atoms are (ascii) identifiers, which str checks in C; the regex covers the rest
+        if not ((atom.isidentifier() and atom.isascii()) or _ATOM_RE.fullmatch(atom)):
+            raise ValueError("atom must be a nonempty str of chars 'a-zA-Z0-9_', with at least 1 non-numerical char, but got: {!r}".format(atom))
         if is_positive is None:  # If is_positive is not passed, assume is True
             is_positive = True
         # TODO: Implement check to ensure is_positive is bool, if not None.
         #     Currently this property is assumed.
+        self._init(atom, is_positive)
+    
+    def _init(self, atom, is_positive):
+        """
+        Sets every slot of this Literal from an already checked atom and sign.
+        Shared by __init__ and _recreated, so the two cannot drift apart.
+        """
+        self._atom = atom
         self._is_positive = is_positive
+        # A Literal's key, telling apart its atom and sign; hashed and compared on
+        self._str = atom if is_positive else "~" + atom
+        self._hash = hash(self._str)
+        self._case = None  # None until set (once) by this Literal's KB
         
     @property  # no setter for atom; this value should not change.
     def atom(self):
@@ -156,6 +181,8 @@ class Literal():
 
     @property  # Raises AttributeError if called before self.case has been set.
     def case(self):
+        if self._case is None:
+            raise AttributeError("case has not been set for Literal: {}".format(self))
         return self._case
     # TODOD: Where this function is called, deal with AttributeError if raised.
     
@@ -165,7 +192,7 @@ class Literal():
         One-time setter for self.case (to a Case obj); its value does not
             change thereafter.
         """
-        if hasattr(self, "_case"):  # If not first time setting self.case
+        if self._case is not None:  # If not first time setting self.case
             raise AttributeError("attribute value can only be set once, and already has value: {}".format(self.case))
         # TODO: Create check to ensure case is Case object.
         #     Currently this property is assumed
@@ -175,24 +202,30 @@ class Literal():
     def is_contained(self):
         """
         True if this Literal is contained by the KB, and False if not.
-        This value is calculated only once on the first call, and relies on the
-            association of a Case object with self.case.
+        This value is held by, and relies on the association of, a Case object
+            with self.case.
         """
-        if not hasattr(self, "_contained"):
-            self._contained = self.case.is_contained
-        return self._contained
+        return self.case.is_contained  # Raises AttributeError if self.case is not set.
     
     @property  # no setter for is_entailed
     def is_entailed(self):
         """
         True if this Literal is entailed by the KB, and False if not.
-        This value is calculated only once on the first call, and relies on the
-            association of a Case object with self.case.
+        This value is held by, and relies on the association of, a Case object
+            with self.case.
+        """
+        # Read from the KB's record of entailed Literals
+        return self.case.is_entailed  # Raises AttributeError if self.case is not set.
+    
+    @property  # no setter for is_supported
+    def is_supported(self):
+        """
+        True if this Literal is contained or entailed by the KB, and False if
+            not.
+        This value is held by, and relies on the association of, a Case object
+            with self.case.
         """
-        if not hasattr(self, "_entailed"):  # If first call to this method
-            # This Literal is supported iff self.case is supported
-            self._entailed = self.case.is_entailed  # May return AttributeError if self.case is not set.
-        return self._entailed
+        return self.case.is_supported  # Raises AttributeError if self.case is not set.
     
     def is_negation_of(self, other):
         """
@@ -200,44 +233,65 @@ class Literal():
             of this Literal. Returns False otherwise.    
         """
         if isinstance(other, Literal):
-            return (self.atom == other.atom) and (self.is_positive != other.is_positive())
+            return (self._is_positive != other._is_positive) and (self._atom == other._atom)
         return False
         
+    def _recreated(self):
+        """
+        Returns a new Literal with the same atom and sign as this Literal, but
+            with no case set.
+        This skips re-checking this Literal's (already checked) atom and sign.
+            KnowledgeBase uses it to recreate every Literal it is made from.
+        """
+        literal = Literal.__new__(Literal)
+        literal._init(self._atom, self._is_positive)
+        return literal
+    
     def negated(self):
         """
         Returns a literal instance with the same atom, but an opposite sign
         """
-        return Literal(self.atom, not self.is_positive)
+        return Literal(self._atom, not self._is_positive)
 
     def __str__(self):
         """
         Returns a string representation of this Literal in prolog syntax (w/o a 
             trailing fullstop)
         """
-        if not self.is_positive:
-            return "~" + self.atom
-        return self.atom
+        return self._str
     
     def __repr__(self):
         return str(self)
         
     def __eq__(self, other):  # Needed for hashability of Literals
+        if self is other:  # Fast path; a KB shares a single instance between all its equal Literals
+            return True
         if isinstance(other, Literal):
-            return (self.atom == other.atom) and (self.is_positive == other.is_positive)
+            return self._str == other._str  # A single str comparison covers both the atom and the sign
         return False
     
     def __hash__(self):  # Needed for hashability of Literals
-        return hash((self.atom, self.is_positive))
+        return self._hash
     
+_literal_str = attrgetter("_str")  # A Literal's cached str, without going through str()
+
 class Clause():
     """
     An object that represents a simple logic clause that asserts a set of
         literals in conjunction.
     
     Properties:
-        literals (set):
-            A set of the Literal instances this Clause asserts.   
+        literals (frozenset):
+            A set of the Literal instances this Clause asserts. This is only
+            built on the first call, from self.sorted_literals.
+        sorted_literals (tuple):
+            The (distinct) Literal instances this Clause asserts, sorted by their
+            str representations. Iterating over a Clause yields these, in this
+            order.
     """
+    
+    __slots__ = ("_literals", "_sorted_literals", "_str", "_hash")
+    
     #TODO Implement checks to ensure literals is a nonempty iterable of Literals       
     def __init__(self, *literals):
         """
@@ -246,23 +300,38 @@ class Clause():
                 The Literal instances this Clause asserts in conjunction.
         Return type: None
         """
-        self._literals = frozenset(literals)
+        # Sorted by str (a Literal's key), so equal Clauses have equal tuples
+        self._sorted_literals = tuple(sorted(set(literals), key=_literal_str))
+        self._hash = hash(self._sorted_literals)
+        self._str = ", ".join(map(_literal_str, self._sorted_literals)) + "."
+        self._literals = None  # The frozenset for self.literals, built on the first call
     
     @property  # no setter for literals
     def literals(self):
+        if self._literals is None:
+            self._literals = frozenset(self._sorted_literals)
         return self._literals
     
+    @property  # no setter for sorted_literals
+    def sorted_literals(self):
+        return self._sorted_literals
+    
+    def __iter__(self):
+        """Returns an iterator over self.sorted_literals"""
+        return iter(self._sorted_literals)
+    
     def __str__(self):
         """Returns a string of the Clause instance in prolog syntax"""
-        return ", ".join([str(l) for l in sorted(list(self.literals), key=lambda x: str(x))]) + "."
+        return self._str
          
     def __eq__(self, other):  # Needed for hashability
         if isinstance(other, Clause):
-            return self.literals == other.literals  # these are frozensets
+            # Check the (cached) hashes first, as they are cheap to compare, before the sorted tuples
+            return (self._hash == other._hash) and (self._sorted_literals == other._sorted_literals)
         return False
     
     def __hash__(self):  # Needed for hashability
-        return hash(self.literals)
+        return self._hash
 
     def __repr__(self):
         return str(self)    
@@ -277,13 +346,16 @@ class Rule():
     Properties:
         head (Literal):
             The Literal that represents this Rule's consequent.
-        body (set of Literals):
-            The Literals which in conjunction represent this Rule's antecedent.
+        body (tuple of Literals):
+            The (distinct) Literals which in conjunction represent this Rule's
+            antecedent, in the order they were given.
         is_supported (bool):
             True if all Literals in this Rule's body are supported by its KB,
             False if not.
     """
     
+    __slots__ = ("_head", "_body", "_body_key", "_supported", "_str", "_hash")
+    
     def __init__(self, head, *body):
         """
         Parameters:
@@ -299,7 +371,11 @@ class Rule():
         self._head = head
         # TODO: Implement check to body is a nonempty iterable of Literals.
         #     Currently this property is assumed.
-        self._body = frozenset(body)
+        self._body = tuple(dict.fromkeys(body))  # In the given order, without repeats
+        self._body_key = frozenset(self._body)  # Order-independent, for __eq__ and __hash__
+        self._hash = hash((head, self._body_key))
+        self._str = head._str + ":- " + ", ".join(map(_literal_str, self._body)) + "."
+        self._supported = None  # None until resolved by its KB or is_supported
     
     @property  # no setter for head; this value should not change.
     def head(self):
@@ -316,26 +392,21 @@ class Rule():
             the KB, and False if not.
         This value is calculated only once on the first call.
         """
-        if not hasattr(self, "_supported"):  # If first call to this method
-            supported = True  # Assume this Rule is supported
-            for l in self.body:
-                if not (l.is_entailed or l.is_contained):  # If a literal in self.body is neither entailed, nor contained by its knowledge base
-                    supported = False  # If any l is unsupported, so is R.
-                    # Keep running through this loop so all literals are asked the questions: "Are you entailed?" and "Are you contained?".
-            self._supported = supported
+        if self._supported is None:  # If first call to this method (and not yet resolved by the KB)
+            self._supported = all(l.is_supported for l in self._body)
         return self._supported
     
     def __str__(self):
         """Returns a strong of the Rule instance in prolog syntax"""
-        return str(self.head) + ":- " + ", ".join([str(l) for l in self.body]) + "."
+        return self._str
     
     def __eq__(self, other):  # Needed for hashability
         if isinstance(other, Rule):
-            return (self.head == other.head) and (self.body == other.body)
+            return (self._hash == other._hash) and (self._head == other._head) and (self._body_key == other._body_key)
         return False
        
     def __hash__(self):  # Needed for hashability
-        return hash((self.head, self.body))
+        return self._hash
         
     def __repr__(self):
         return str(self)        
@@ -0,0 +1,26 @@
+import unittest
+
+from argumentation import Case
+from knowledgebase import KnowledgeBase
+from logic import Literal
+
+
+class CaseTest(unittest.TestCase):
+
+    def test_case_of_an_equal_literal_that_is_not_the_kbs_instance(self):
+        kb = KnowledgeBase("a :- b. b.")
+        literal = Literal("a")
+        self.assertIsNot(literal, kb._literals_dict["a"])
+        case = Case(literal, kb)
+        self.assertTrue(case.is_entailed)
+        self.assertFalse(case.is_contained)
+        self.assertEqual(case.asserting_rules, kb._literals_dict["a"].case.asserting_rules)
+
+    def test_case_of_a_literal_not_in_the_kb(self):
+        kb = KnowledgeBase("a :- b. b.")
+        with self.assertRaises(ValueError):
+            Case(Literal("c"), kb)
+
+
+if __name__ == "__main__":
+    unittest.main()
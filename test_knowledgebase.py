@@ -0,0 +1,36 @@
+import unittest
+
+from knowledgebase import KnowledgeBase
+from logic import Literal, Rule
+
+
+class CycleTest(unittest.TestCase):
+
+    def test_two_cycle_is_rejected(self):
+        with self.assertRaises(ValueError):
+            KnowledgeBase("a :- b. b :- a.")
+
+    def test_self_loop_is_rejected(self):
+        with self.assertRaises(ValueError):
+            KnowledgeBase("a :- a.")
+
+    def test_cycle_from_rule_objects_is_rejected(self):
+        a, b = Literal("a"), Literal("b")
+        with self.assertRaises(ValueError):
+            KnowledgeBase(Rule(a, b), Rule(b, a))
+
+    def test_acyclic_diamond_is_accepted(self):
+        kb = KnowledgeBase("a :- b, c. b :- d. c :- d. d.")
+        self.assertEqual(sorted(kb._supported_literals), ["a", "b", "c"])
+
+
+class PrologStringAtomTest(unittest.TestCase):
+
+    def test_invalid_atoms_in_prolog_strings(self):
+        for s in ("a-b.", "é.", "a : b.", "a:b. c."):
+            with self.assertRaises(ValueError):
+                KnowledgeBase(s)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+import unittest
+
+from logic import Literal
+
+
+class AtomTest(unittest.TestCase):
+
+    def test_valid_atoms(self):
+        for atom in ("a", "_", "a1", "1a", "James_passed_module_CM1234"):
+            self.assertEqual(Literal(atom).atom, atom)
+
+    def test_invalid_atoms(self):
+        for atom in ("", "1", "a-b", "a b", "é", "~a", "a:b"):
+            with self.assertRaises(ValueError):
+                Literal(atom)
+
+    def test_non_str_atom(self):
+        with self.assertRaises(TypeError):
+            Literal(5)
+
+
+if __name__ == "__main__":
+    unittest.main()